@@ -16,12 +16,621 @@ import schedule
 import time
 from datetime import datetime
 import sys
+import queue
+import sqlite3
+import gc
+import re
+import hashlib
+import ctypes
+import subprocess
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 import winreg
 from PIL import Image, ImageDraw
 import pystray
 
 
+class DiffCache:
+    """렌더링된 파일별 diff를 보관하는 LRU 캐시"""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """캐시된 diff 반환 (없으면 None)"""
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key, value):
+        """diff 저장 후 오래된 항목 제거"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class PushPreviewDialog:
+    """커밋 전 변경사항 미리보기 창
+
+    git diff --numstat 결과를 스트리밍으로 받아 파일 목록에 채우고,
+    파일을 선택하면 해당 파일의 diff만 지연 로딩합니다.
+    """
+
+    BATCH_SIZE = 500  # 한 번에 목록에 추가할 최대 항목 수
+    POLL_MS = 50  # 큐 확인 주기
+    MAX_DIFF_LINES = 2000  # 화면에 표시할 diff 최대 줄 수
+    MAX_UNTRACKED_BYTES = 256 * 1024  # 새 파일 미리보기 최대 크기
+
+    SECTION_LABELS = {
+        "staged": "스테이징됨",
+        "unstaged": "수정됨",
+        "untracked": "새 파일",
+    }
+
+    def __init__(self, parent, repo, pathspecs=()):
+        self.parent = parent
+        self.repo = repo
+        self.pathspecs = list(pathspecs)  # 목록에서 제외할 경로 등 (churn 필터)
+        self.diff_cache = DiffCache()
+        self.result = False
+        self.closed = False
+
+        self.queue = queue.Queue()
+        self.processes = []
+        self.pending_streams = 0
+        self.items = {}  # Treeview item id -> (구분, 경로, 바이너리 여부)
+        self.file_count = 0
+        self.added_total = 0
+        self.deleted_total = 0
+        self.binary_count = 0
+        self.error = None
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Push 미리보기")
+        self.window.geometry("900x550")
+        self.window.transient(parent)
+        self.window.protocol("WM_DELETE_WINDOW", self.on_cancel)
+
+        self.create_ui()
+        self.start_streams()
+        self.window.after(self.POLL_MS, self.poll_queue)
+
+    def create_ui(self):
+        """미리보기 UI 생성"""
+        self.summary_var = tk.StringVar(value="변경사항 불러오는 중...")
+        ttk.Label(self.window, textvariable=self.summary_var,
+                  font=('Arial', 10, 'bold')).pack(anchor=tk.W, padx=10, pady=(10, 5))
+
+        paned = ttk.PanedWindow(self.window, orient=tk.HORIZONTAL)
+        paned.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        list_frame = ttk.Frame(paned)
+        paned.add(list_frame, weight=1)
+
+        columns = ("section", "added", "deleted", "path")
+        self.file_tree = ttk.Treeview(list_frame, columns=columns, show="headings", selectmode="browse")
+        self.file_tree.heading("section", text="구분")
+        self.file_tree.heading("added", text="+")
+        self.file_tree.heading("deleted", text="-")
+        self.file_tree.heading("path", text="파일")
+        self.file_tree.column("section", width=70, stretch=False)
+        self.file_tree.column("added", width=50, stretch=False, anchor=tk.E)
+        self.file_tree.column("deleted", width=50, stretch=False, anchor=tk.E)
+        self.file_tree.column("path", width=250)
+
+        tree_scroll = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.file_tree.yview)
+        self.file_tree.configure(yscrollcommand=tree_scroll.set)
+        self.file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.file_tree.bind("<<TreeviewSelect>>", self.on_file_selected)
+
+        diff_frame = ttk.Frame(paned)
+        paned.add(diff_frame, weight=2)
+
+        self.diff_text = scrolledtext.ScrolledText(diff_frame, wrap=tk.NONE, font=('Consolas', 9))
+        self.diff_text.pack(fill=tk.BOTH, expand=True)
+        self.diff_text.tag_config("add", foreground="green")
+        self.diff_text.tag_config("remove", foreground="red")
+        self.diff_text.tag_config("hunk", foreground="blue")
+        self.diff_text.insert(tk.END, "파일을 선택하면 diff가 표시됩니다")
+        self.diff_text.config(state=tk.DISABLED)
+
+        button_frame = ttk.Frame(self.window, padding="10")
+        button_frame.pack(fill=tk.X)
+        ttk.Button(button_frame, text="취소", command=self.on_cancel).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="⬆️ 커밋 및 Push", command=self.on_confirm).pack(side=tk.RIGHT, padx=5)
+
+    def show(self):
+        """창을 모달로 띄우고 사용자가 Push를 승인했는지 반환"""
+        self.window.grab_set()
+        self.parent.wait_window(self.window)
+        return self.result
+
+    # 스트리밍
+    def start_streams(self):
+        """staged / unstaged / untracked 목록을 백그라운드 스레드로 수집"""
+        streams = [
+            ("staged", ["diff", "--cached", "--numstat", "--no-renames", "-z"]),
+            ("unstaged", ["diff", "--numstat", "--no-renames", "-z"]),
+            ("untracked", ["ls-files", "--others", "--exclude-standard", "-z"]),
+        ]
+        self.pending_streams = len(streams)
+        for section, args in streams:
+            if self.pathspecs:
+                args = args + ["--"] + self.pathspecs
+            thread = threading.Thread(target=self.read_stream, args=(section, args), daemon=True)
+            thread.start()
+
+    def read_stream(self, section, args):
+        """git 출력을 NUL 단위로 읽어 큐에 전달
+
+        core.autocrlf 경고처럼 stderr 출력이 많으면 파이프가 가득 차 git이 멈추므로
+        stderr는 별도 스레드에서 계속 비우고, 실패 시 마지막 부분만 오류로 보고합니다.
+        """
+        try:
+            proc = self.repo.git.execute(["git"] + args, as_process=True)
+            self.processes.append(proc)
+            stderr_tail = deque(maxlen=20)
+            stderr_thread = threading.Thread(target=self.drain_stderr, args=(proc.proc.stderr, stderr_tail),
+                                             daemon=True)
+            stderr_thread.start()
+
+            buffer = b""
+            while not self.closed:
+                chunk = proc.stdout.read1(65536)
+                if not chunk:
+                    break
+                buffer += chunk
+                *records, buffer = buffer.split(b"\0")
+                entries = [self.parse_record(section, record) for record in records if record]
+                if entries:
+                    self.queue.put(("files", entries))
+            proc.proc.wait()
+            stderr_thread.join()
+            if proc.proc.returncode != 0 and not self.closed:
+                error = b"".join(stderr_tail).decode("utf-8", errors="replace").strip()
+                self.queue.put(("error", f"{section}: {error or proc.proc.returncode}"))
+        except Exception as e:
+            self.queue.put(("error", f"{section}: {e}"))
+        finally:
+            self.queue.put(("done", section))
+
+    @staticmethod
+    def drain_stderr(stream, tail):
+        """stderr를 끝까지 읽으며 마지막 줄들만 보관"""
+        for line in iter(stream.readline, b""):
+            tail.append(line)
+
+    @staticmethod
+    def parse_record(section, record):
+        """numstat / ls-files 레코드를 (구분, 추가, 삭제, 경로) 튜플로 변환"""
+        text = record.decode("utf-8", errors="replace")
+        if section == "untracked":
+            return section, None, None, text
+
+        added, deleted, path = text.split("\t", 2)
+        if added == "-" and deleted == "-":
+            # 바이너리 파일
+            return section, "-", "-", path
+        return section, int(added), int(deleted), path
+
+    def poll_queue(self):
+        """큐에 쌓인 결과를 일정량씩 목록에 반영"""
+        if self.closed:
+            return
+
+        inserted = 0
+        try:
+            while inserted < self.BATCH_SIZE:
+                kind, payload = self.queue.get_nowait()
+                if kind == "files":
+                    for entry in payload:
+                        self.add_file_entry(*entry)
+                    inserted += len(payload)
+                elif kind == "diff":
+                    self.on_diff_loaded(*payload)
+                elif kind == "error":
+                    self.error = payload
+                elif kind == "done":
+                    self.pending_streams -= 1
+        except queue.Empty:
+            pass
+
+        self.update_summary()
+        self.window.after(self.POLL_MS, self.poll_queue)
+
+    def add_file_entry(self, section, added, deleted, path):
+        """파일 목록에 한 줄 추가"""
+        binary = added == "-"
+        if binary:
+            self.binary_count += 1
+        elif added is not None:
+            self.added_total += added
+            self.deleted_total += deleted
+
+        values = (
+            self.SECTION_LABELS[section],
+            "" if added is None else added,
+            "" if deleted is None else deleted,
+            path,
+        )
+        item_id = self.file_tree.insert("", tk.END, values=values)
+        self.items[item_id] = (section, path, binary)
+        self.file_count += 1
+
+    def update_summary(self):
+        """상단 요약 문구 갱신"""
+        status = "불러오는 중..." if self.pending_streams > 0 else "완료"
+        summary = f"변경 파일 {self.file_count}개 (+{self.added_total} / -{self.deleted_total})"
+        if self.binary_count:
+            summary += f", 바이너리 {self.binary_count}개"
+        if self.error:
+            status = f"오류: {self.error}"
+        self.summary_var.set(f"{summary} - {status}")
+
+    # 파일별 diff
+    def on_file_selected(self, event=None):
+        """선택한 파일의 diff 표시 (캐시 우선)"""
+        selection = self.file_tree.selection()
+        if not selection:
+            return
+
+        section, path, binary = self.items[selection[0]]
+        if binary:
+            self.show_diff("바이너리 파일 - diff를 표시하지 않습니다")
+            return
+
+        key = (section, path)
+        cached = self.diff_cache.get(key)
+        if cached is not None:
+            self.show_diff(cached)
+            return
+
+        self.show_diff("diff 불러오는 중...")
+        thread = threading.Thread(target=self.load_diff, args=(section, path), daemon=True)
+        thread.start()
+
+    def load_diff(self, section, path):
+        """파일 하나의 diff를 백그라운드에서 불러오기"""
+        try:
+            if section == "untracked":
+                diff = self.read_untracked_file(path)
+            elif section == "staged":
+                diff = self.repo.git.diff("--cached", "--", path)
+            else:
+                diff = self.repo.git.diff("--", path)
+        except Exception as e:
+            diff = f"diff 불러오기 오류: {e}"
+
+        lines = diff.splitlines()
+        if len(lines) > self.MAX_DIFF_LINES:
+            omitted = len(lines) - self.MAX_DIFF_LINES
+            diff = "\n".join(lines[:self.MAX_DIFF_LINES]) + f"\n\n... {omitted}줄 생략"
+        self.queue.put(("diff", (section, path, diff)))
+
+    def read_untracked_file(self, path):
+        """새 파일 내용을 diff 형식으로 읽기"""
+        full_path = os.path.join(self.repo.working_tree_dir, path)
+        with open(full_path, 'rb') as f:
+            data = f.read(self.MAX_UNTRACKED_BYTES)
+        if b"\0" in data[:8000]:
+            return "바이너리 파일 - diff를 표시하지 않습니다"
+
+        text = data.decode("utf-8", errors="replace")
+        return f"새 파일: {path}\n" + "\n".join(f"+{line}" for line in text.splitlines())
+
+    def on_diff_loaded(self, section, path, diff):
+        """불러온 diff를 캐시하고, 아직 선택 중이면 표시"""
+        self.diff_cache.put((section, path), diff)
+        selection = self.file_tree.selection()
+        if selection and self.items.get(selection[0])[:2] == (section, path):
+            self.show_diff(diff)
+
+    def show_diff(self, diff):
+        """diff 텍스트를 색상과 함께 표시"""
+        self.diff_text.config(state=tk.NORMAL)
+        self.diff_text.delete(1.0, tk.END)
+        for line in diff.splitlines():
+            if line.startswith("+") and not line.startswith("+++"):
+                tag = "add"
+            elif line.startswith("-") and not line.startswith("---"):
+                tag = "remove"
+            elif line.startswith("@@"):
+                tag = "hunk"
+            else:
+                tag = None
+            self.diff_text.insert(tk.END, line + "\n", tag)
+        self.diff_text.config(state=tk.DISABLED)
+
+    # 버튼
+    def on_confirm(self):
+        """Push 진행"""
+        self.result = True
+        self.close()
+
+    def on_cancel(self):
+        """Push 취소"""
+        self.result = False
+        self.close()
+
+    def close(self):
+        """실행 중인 git 프로세스 정리 후 창 닫기"""
+        self.closed = True
+        for proc in self.processes:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+        self.window.grab_release()
+        self.window.destroy()
+
+
+class SearchIndex:
+    """등록된 저장소의 노트(HEAD 기준)와 커밋 메시지에 대한 SQLite FTS5 색인
+
+    저장소마다 마지막으로 색인한 커밋을 기록해두고, 이후에는
+    그 커밋과 새 HEAD 사이의 diff만 반영합니다. 노트 내용은 작업 폴더가 아닌
+    git 객체에서 읽습니다.
+    """
+
+    NOTE_EXTENSIONS = ('.md', '.txt', '.canvas')  # 색인할 노트 확장자
+    MAX_NOTE_BYTES = 1024 * 1024  # 색인할 노트 최대 크기
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        with self.connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS repo_state (
+                    repo_path TEXT PRIMARY KEY,
+                    last_commit TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS notes (
+                    id INTEGER PRIMARY KEY,
+                    repo_path TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    UNIQUE (repo_path, path)
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(path, content);
+                CREATE TABLE IF NOT EXISTS commits (
+                    id INTEGER PRIMARY KEY,
+                    repo_path TEXT NOT NULL,
+                    hexsha TEXT NOT NULL,
+                    committed_date INTEGER NOT NULL,
+                    author TEXT NOT NULL,
+                    UNIQUE (repo_path, hexsha)
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS commits_fts USING fts5(message);
+            """)
+
+    @contextmanager
+    def connect(self):
+        """SQLite 연결 열기 (스레드마다 별도 연결 사용, 종료 시 커밋 후 닫기)"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # 색인 갱신
+    def update_repo(self, repo_path):
+        """저장소 색인을 HEAD까지 갱신하고 (변경된 노트 수, 추가된 커밋 수) 반환"""
+        with self.lock, git.Repo(repo_path) as repo, self.connect() as conn:
+            try:
+                head = repo.head.commit
+            except ValueError:
+                # 커밋이 없는 저장소
+                return 0, 0
+
+            row = conn.execute("SELECT last_commit FROM repo_state WHERE repo_path = ?",
+                               (repo_path,)).fetchone()
+            last_commit = row[0] if row else None
+            if last_commit == head.hexsha:
+                return 0, 0
+
+            incremental = False
+            if last_commit:
+                try:
+                    incremental = repo.is_ancestor(last_commit, head.hexsha)
+                except git.GitCommandError:
+                    # 강제 push 등으로 이전 커밋이 사라진 경우
+                    incremental = False
+
+            if incremental:
+                note_count = self.apply_diff(conn, repo, repo_path, last_commit, head)
+                commit_range = f"{last_commit}..{head.hexsha}"
+            else:
+                self.delete_repo_rows(conn, repo_path)
+                note_count = self.index_tree(conn, repo_path, head)
+                commit_range = head.hexsha
+
+            commit_count = self.index_commits(conn, repo, repo_path, commit_range)
+            conn.execute("INSERT OR REPLACE INTO repo_state (repo_path, last_commit) VALUES (?, ?)",
+                         (repo_path, head.hexsha))
+            return note_count, commit_count
+
+    def index_tree(self, conn, repo_path, commit):
+        """커밋 트리의 모든 노트 색인"""
+        count = 0
+        for item in commit.tree.traverse():
+            if item.type == 'blob' and self.put_note(conn, repo_path, item.path, item):
+                count += 1
+        return count
+
+    def apply_diff(self, conn, repo, repo_path, old_commit, new_commit):
+        """두 커밋 사이에서 바뀐 노트만 색인에 반영"""
+        output = repo.git.diff("--name-status", "--no-renames", "-z", old_commit, new_commit.hexsha)
+        fields = output.split("\0")
+        count = 0
+        for status, path in zip(fields[0::2], fields[1::2]):
+            if not path.lower().endswith(self.NOTE_EXTENSIONS):
+                continue
+            if status == "D":
+                changed = self.delete_note(conn, repo_path, path)
+            else:
+                try:
+                    blob = new_commit.tree / path
+                except KeyError:
+                    continue
+                changed = self.put_note(conn, repo_path, path, blob)
+            if changed:
+                count += 1
+        return count
+
+    def put_note(self, conn, repo_path, path, blob):
+        """노트 하나를 색인에 추가하거나 교체
+
+        바이너리가 되었거나 너무 커진 노트는 이전 내용만 삭제합니다.
+        색인이 바뀌었으면 True를 반환합니다.
+        """
+        if not path.lower().endswith(self.NOTE_EXTENSIONS):
+            return False
+
+        deleted = self.delete_note(conn, repo_path, path)
+        if blob.size > self.MAX_NOTE_BYTES:
+            return deleted
+
+        data = blob.data_stream.read()
+        if b"\0" in data[:8000]:
+            return deleted
+
+        cursor = conn.execute("INSERT INTO notes (repo_path, path) VALUES (?, ?)", (repo_path, path))
+        conn.execute("INSERT INTO notes_fts (rowid, path, content) VALUES (?, ?, ?)",
+                     (cursor.lastrowid, path, data.decode("utf-8", errors="replace")))
+        return True
+
+    def delete_note(self, conn, repo_path, path):
+        """노트 하나를 색인에서 삭제 (삭제한 항목이 있으면 True)"""
+        row = conn.execute("SELECT id FROM notes WHERE repo_path = ? AND path = ?",
+                           (repo_path, path)).fetchone()
+        if not row:
+            return False
+        conn.execute("DELETE FROM notes_fts WHERE rowid = ?", row)
+        conn.execute("DELETE FROM notes WHERE id = ?", row)
+        return True
+
+    def index_commits(self, conn, repo, repo_path, rev):
+        """지정 범위의 커밋 메시지 색인"""
+        count = 0
+        for commit in repo.iter_commits(rev):
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO commits (repo_path, hexsha, committed_date, author) VALUES (?, ?, ?, ?)",
+                (repo_path, commit.hexsha, commit.committed_date, commit.author.name))
+            if cursor.rowcount:
+                conn.execute("INSERT INTO commits_fts (rowid, message) VALUES (?, ?)",
+                             (cursor.lastrowid, commit.message))
+                count += 1
+        return count
+
+    def delete_repo_rows(self, conn, repo_path):
+        """저장소의 모든 색인 데이터 삭제"""
+        conn.execute("DELETE FROM notes_fts WHERE rowid IN (SELECT id FROM notes WHERE repo_path = ?)",
+                     (repo_path,))
+        conn.execute("DELETE FROM notes WHERE repo_path = ?", (repo_path,))
+        conn.execute("DELETE FROM commits_fts WHERE rowid IN (SELECT id FROM commits WHERE repo_path = ?)",
+                     (repo_path,))
+        conn.execute("DELETE FROM commits WHERE repo_path = ?", (repo_path,))
+        conn.execute("DELETE FROM repo_state WHERE repo_path = ?", (repo_path,))
+
+    def remove_repo(self, repo_path):
+        """저장소를 색인에서 제거"""
+        with self.lock, self.connect() as conn:
+            self.delete_repo_rows(conn, repo_path)
+
+    # 검색
+    @staticmethod
+    def build_match_query(query):
+        """입력 문자열을 FTS5 접두어 검색식으로 변환"""
+        terms = query.split()
+        return " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+    def search(self, query, limit=50):
+        """노트와 커밋 검색 결과를 (구분, 저장소 경로, 항목, 요약) 튜플 리스트로 반환"""
+        match = self.build_match_query(query)
+        if not match:
+            return []
+
+        with self.connect() as conn:
+            note_rows = conn.execute("""
+                SELECT notes.repo_path, notes.path,
+                       snippet(notes_fts, 1, '[', ']', '…', 12)
+                FROM notes_fts JOIN notes ON notes.id = notes_fts.rowid
+                WHERE notes_fts MATCH ?
+                ORDER BY rank LIMIT ?
+            """, (match, limit)).fetchall()
+            commit_rows = conn.execute("""
+                SELECT commits.repo_path, commits.hexsha, commits.committed_date,
+                       snippet(commits_fts, 0, '[', ']', '…', 12)
+                FROM commits_fts JOIN commits ON commits.id = commits_fts.rowid
+                WHERE commits_fts MATCH ?
+                ORDER BY rank LIMIT ?
+            """, (match, limit)).fetchall()
+
+        results = [("note", repo_path, path, snippet) for repo_path, path, snippet in note_rows]
+        for repo_path, hexsha, committed_date, snippet in commit_rows:
+            commit_time = datetime.fromtimestamp(committed_date).strftime('%Y-%m-%d %H:%M')
+            results.append(("commit", repo_path, f"{hexsha[:7]} ({commit_time})", snippet))
+        return results
+
+
+def get_resident_memory():
+    """현재 프로세스의 상주 메모리(바이트) 반환 (측정 불가 시 None)"""
+    try:
+        if sys.platform == "win32":
+            class ProcessMemoryCounters(ctypes.Structure):
+                _fields_ = [
+                    ("cb", ctypes.c_ulong),
+                    ("PageFaultCount", ctypes.c_ulong),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize
+            return None
+
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return None
+
+
+def format_memory(size):
+    """메모리 크기를 MB 문자열로 변환"""
+    return "측정 불가" if size is None else f"{size / (1024 * 1024):.1f}MB"
+
+
 class GitManager:
+    MAX_LOG_LINES = 2000  # 로그 탭에 유지할 최대 줄 수
+    MAX_PENDING_LOGS = 500  # 아직 화면에 반영하지 않은 로그 최대 보관 수
+    EVENT_POLL_MS = 200  # 백그라운드 스레드 로그 반영 주기
+    MAX_MIRROR_PUSHES = 8  # 동시에 실행할 최대 미러 push 수
+    PUSHED_REF_PREFIX = "refs/gitmanager/pushed/"  # 미러별로 마지막으로 push한 커밋 기록
+    MAX_SUMMARY_FILES = 50  # 요약 커밋 메시지에 나열할 최대 파일 수
+    EMPTY_TREE_SHA = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"  # 첫 커밋 비교용 빈 트리
+
+    # Obsidian이 계속 다시 쓰는 편집기 상태 파일 (git pathspec glob 형식)
+    DEFAULT_CHURN_PATTERNS = [
+        ".obsidian/workspace",
+        ".obsidian/workspace.json",
+        ".obsidian/workspace-mobile.json",
+        "**/.DS_Store",
+    ]
+
     def __init__(self, root):
         self.root = root
         self.root.title(f"Git Manager v{__version__}")
@@ -31,13 +640,32 @@ class GitManager:
         appdata_dir = os.path.join(os.getenv('APPDATA'), 'GitManager')
         os.makedirs(appdata_dir, exist_ok=True)
         self.config_file = os.path.join(appdata_dir, 'config.json')
+
+        # 화면에 반영할 로그 (여러 스레드에서 쌓고 Tk 스레드에서만 반영)
+        self.ui_active = False
+        self.log_lock = threading.Lock()
+        self.pending_logs = deque(maxlen=self.MAX_PENDING_LOGS)
+
         self.config = self.load_config()
         self.repo = None
 
+        # 전체 저장소 검색 색인
+        self.search_index = SearchIndex(os.path.join(appdata_dir, 'search_index.db'))
+
         # 자동 동기화 스레드
         self.sync_thread = None
         self.sync_running = False
 
+        # 추가 push 대상(백업 미러) 작업과 결과 기록
+        # 미러 push는 데몬 스레드에서 실행하고, 종료 시 실행 중인 git 프로세스를 정리
+        self.closing = False
+        self.mirror_slots = threading.BoundedSemaphore(self.MAX_MIRROR_PUSHES)
+        self.mirror_lock = threading.Lock()
+        self.mirror_processes = set()
+        self.mirror_inflight = {}  # 저장소 경로 -> push 중인 커밋 SHA 목록
+        self.push_result_queue = queue.Queue()  # 작업 스레드 -> Tk 스레드로 넘길 push 결과
+        self.push_results = {}  # (저장소 경로, 대상) -> {"success", "latency", "time", "error"}
+
         # 시스템 트레이
         self.tray_icon = None
         self.minimized_to_tray = False
@@ -45,13 +673,24 @@ class GitManager:
         # UI 생성
         self.create_ui()
 
+        # 초기 로그
+        self.log_message("Git Manager 시작됨", "info")
+        if self.config.get("repo_path"):
+            self.log_message(f"저장소: {self.config['repo_path']}", "info")
+
         # 윈도우 닫기 이벤트 설정
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # 백그라운드 스레드가 쌓은 로그를 주기적으로 반영
+        self.process_pending_events()
+
         # 경로가 존재하면 저장소 초기화
         if self.config.get("repo_path"):
             self.set_repo_path(self.config["repo_path"])
 
+        # 검색 색인 갱신 (변경분만 반영)
+        self.update_search_index()
+
     def load_config(self):
         """JSON 파일에서 설정 불러오기"""
         default_config = {
@@ -60,10 +699,17 @@ class GitManager:
             "auto_sync_enabled": False,
             "pull_time": "09:00",
             "push_time": "18:00",
-            "repositories": [],  # 저장소 리스트: [{"name": "이름", "path": "경로"}, ...]
+            "repositories": [],  # 저장소 리스트: [{"name": "이름", "path": "경로", "push_remotes": [...]}, ...]
             "current_repo_index": -1,  # 현재 선택된 저장소 인덱스
             "minimize_to_tray": False,  # 백그라운드 실행 (시스템 트레이)
-            "auto_start": False  # PC 시작 시 자동 실행
+            "auto_start": False,  # PC 시작 시 자동 실행
+            "show_push_preview": True,  # Push 전 변경사항 미리보기
+            "low_footprint_tray": True,  # 트레이 실행 중 UI와 저장소 핸들 해제
+            "mirror_push_timeout": 120,  # 추가 push 대상(백업 미러) 제한 시간(초)
+            "coalesce_commits": False,  # push 전 아직 push되지 않은 자동 커밋을 하나로 합치기
+            "summarize_commit_message": False,  # 커밋 메시지에 변경된 노트 목록 추가
+            "churn_filter_enabled": True,  # 편집기 상태 파일 변경은 커밋/Push 대상에서 제외
+            "churn_patterns": list(self.DEFAULT_CHURN_PATTERNS)  # 저장소별로 "churn_patterns"를 지정하면 대체
         }
 
         if os.path.exists(self.config_file):
@@ -105,6 +751,7 @@ class GitManager:
         ttk.Button(top_frame, text="찾아보기", command=self.browse_folder).pack(side=tk.LEFT, padx=5)
         ttk.Button(top_frame, text="💾 저장", command=self.save_current_repo).pack(side=tk.LEFT, padx=5)
         ttk.Button(top_frame, text="🗑️ 삭제", command=self.delete_current_repo).pack(side=tk.LEFT, padx=5)
+        ttk.Button(top_frame, text="🔁 미러", command=self.edit_push_remotes).pack(side=tk.LEFT, padx=5)
 
         # 빠른 작업 버튼
         button_frame = ttk.Frame(self.root, padding="10")
@@ -147,7 +794,38 @@ class GitManager:
         self.history_text = scrolledtext.ScrolledText(history_frame, height=15, wrap=tk.WORD)
         self.history_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # 탭 3: 자동 동기화
+        # 탭 3: 검색
+        search_frame = ttk.Frame(notebook)
+        notebook.add(search_frame, text="검색")
+
+        search_toolbar = ttk.Frame(search_frame)
+        search_toolbar.pack(fill=tk.X, padx=5, pady=5)
+
+        ttk.Label(search_toolbar, text="검색어:").pack(side=tk.LEFT, padx=5)
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_toolbar, textvariable=self.search_var, width=40)
+        search_entry.pack(side=tk.LEFT, padx=5)
+        search_entry.bind("<Return>", self.run_search)
+        ttk.Button(search_toolbar, text="검색", command=self.run_search).pack(side=tk.LEFT, padx=5)
+        ttk.Button(search_toolbar, text="색인 갱신", command=self.update_search_index).pack(side=tk.LEFT, padx=5)
+
+        self.search_status_var = tk.StringVar(value="노트 내용과 커밋 메시지를 전체 저장소에서 검색합니다")
+        ttk.Label(search_frame, textvariable=self.search_status_var,
+                  foreground="gray").pack(anchor=tk.W, padx=10)
+
+        columns = ("kind", "repo", "item", "snippet")
+        self.search_tree = ttk.Treeview(search_frame, columns=columns, show="headings")
+        self.search_tree.heading("kind", text="구분")
+        self.search_tree.heading("repo", text="저장소")
+        self.search_tree.heading("item", text="노트 / 커밋")
+        self.search_tree.heading("snippet", text="내용")
+        self.search_tree.column("kind", width=50, stretch=False)
+        self.search_tree.column("repo", width=120, stretch=False)
+        self.search_tree.column("item", width=200)
+        self.search_tree.column("snippet", width=350)
+        self.search_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # 탭 4: 자동 동기화
         autosync_frame = ttk.Frame(notebook)
         notebook.add(autosync_frame, text="자동 동기화")
 
@@ -173,7 +851,7 @@ class GitManager:
         self.schedule_status_text = scrolledtext.ScrolledText(autosync_frame, height=8, wrap=tk.WORD)
         self.schedule_status_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        # 탭 4: 설정
+        # 탭 5: 설정
         settings_frame = ttk.Frame(notebook)
         notebook.add(settings_frame, text="설정")
 
@@ -184,6 +862,23 @@ class GitManager:
         self.commit_msg_var = tk.StringVar(value=self.config.get("commit_message", "update"))
         ttk.Entry(settings_frame, textvariable=self.commit_msg_var, width=50).pack(padx=10, pady=5)
 
+        self.summarize_commit_message_var = tk.BooleanVar(value=self.config.get("summarize_commit_message", False))
+        ttk.Checkbutton(settings_frame, text="커밋 메시지에 변경된 노트 목록 추가",
+                       variable=self.summarize_commit_message_var).pack(anchor=tk.W, padx=30, pady=5)
+
+        self.coalesce_commits_var = tk.BooleanVar(value=self.config.get("coalesce_commits", False))
+        ttk.Checkbutton(settings_frame, text="아직 push되지 않은 자동 커밋을 하나로 합치기",
+                       variable=self.coalesce_commits_var).pack(anchor=tk.W, padx=30, pady=5)
+
+        # 편집기 상태 파일 필터
+        self.churn_filter_var = tk.BooleanVar(value=self.config.get("churn_filter_enabled", True))
+        ttk.Checkbutton(settings_frame, text="편집기 상태 파일 변경 무시 (커밋/Push 대상에서 제외, 쉼표로 구분):",
+                       variable=self.churn_filter_var).pack(anchor=tk.W, padx=30, pady=5)
+
+        self.churn_patterns_var = tk.StringVar(
+            value=", ".join(self.config.get("churn_patterns", self.DEFAULT_CHURN_PATTERNS)))
+        ttk.Entry(settings_frame, textvariable=self.churn_patterns_var, width=60).pack(anchor=tk.W, padx=50, pady=5)
+
         # 구분선
         ttk.Separator(settings_frame, orient='horizontal').pack(fill=tk.X, padx=10, pady=20)
 
@@ -196,11 +891,21 @@ class GitManager:
         ttk.Checkbutton(settings_frame, text="닫기 버튼 클릭 시 백그라운드 실행 (시스템 트레이로 최소화)",
                        variable=self.minimize_to_tray_var).pack(anchor=tk.W, padx=30, pady=5)
 
+        # 저자원 트레이 모드
+        self.low_footprint_tray_var = tk.BooleanVar(value=self.config.get("low_footprint_tray", True))
+        ttk.Checkbutton(settings_frame, text="백그라운드 실행 중 화면과 저장소 연결 해제 (메모리 절약)",
+                       variable=self.low_footprint_tray_var).pack(anchor=tk.W, padx=30, pady=5)
+
         # 자동 시작
         self.auto_start_var = tk.BooleanVar(value=self.config.get("auto_start", False))
         ttk.Checkbutton(settings_frame, text="Windows 시작 시 자동 실행",
                        variable=self.auto_start_var).pack(anchor=tk.W, padx=30, pady=5)
 
+        # Push 미리보기
+        self.show_push_preview_var = tk.BooleanVar(value=self.config.get("show_push_preview", True))
+        ttk.Checkbutton(settings_frame, text="Quick Push 전 변경사항 미리보기",
+                       variable=self.show_push_preview_var).pack(anchor=tk.W, padx=30, pady=5)
+
         # 설명 레이블
         ttk.Label(settings_frame, text="💡 백그라운드 실행: 프로그램을 닫으면 시스템 트레이에서 실행됩니다",
                  foreground="gray", font=('Arial', 8)).pack(anchor=tk.W, padx=30, pady=(0, 5))
@@ -209,7 +914,7 @@ class GitManager:
 
         ttk.Button(settings_frame, text="설정 저장", command=self.save_settings).pack(padx=10, pady=10)
 
-        # 탭 5: 로그
+        # 탭 6: 로그
         log_frame = ttk.Frame(notebook)
         notebook.add(log_frame, text="로그")
 
@@ -221,10 +926,9 @@ class GitManager:
         self.log_text.tag_config("error", foreground="red")
         self.log_text.tag_config("info", foreground="blue")
 
-        # 초기 로그
-        self.log_message("Git Manager 시작됨", "info")
-        if self.config.get("repo_path"):
-            self.log_message(f"저장소: {self.config['repo_path']}", "info")
+        # UI가 없는 동안 쌓인 로그 반영
+        self.ui_active = True
+        self.flush_logs()
 
         # 저장소 콤보박스 로드
         self.refresh_repo_combo()
@@ -278,14 +982,18 @@ class GitManager:
             origin = self.repo.remotes.origin
             result = origin.pull()
             self.log_message(f"Pull 완료: {result}", "success")
+            self.update_search_index([self.config.get("repo_path", "")])
             self.refresh_status()
             messagebox.showinfo("성공", "Pull이 성공적으로 완료되었습니다!")
         except Exception as e:
             self.log_message(f"Pull 오류: {e}", "error")
             messagebox.showerror("오류", f"Pull 실패:\n{e}")
 
-    def quick_push(self):
-        """git add, commit, push 실행"""
+    def quick_push(self, preview=True):
+        """git add, commit, push 실행
+
+        preview가 True이고 설정이 켜져 있으면 커밋 전에 미리보기 창을 띄웁니다.
+        """
         # ALL 옵션 선택 시 전체 저장소 Push
         selected = self.repo_combo_var.get()
         if selected == "🌐 ALL":
@@ -298,25 +1006,30 @@ class GitManager:
 
         self.log_message("Quick Push 실행 중...", "info")
         try:
-            # 변경사항 확인
-            if not self.repo.is_dirty(untracked_files=True):
+            # 변경사항 확인 (편집기 상태 파일 변경은 제외)
+            changes = self.check_changes(self.repo)
+            if changes != "dirty":
+                if changes == "churn":
+                    self.log_message("편집기 상태 파일만 변경되어 건너뜀", "info")
                 self.log_message("커밋할 변경사항이 없습니다", "info")
                 messagebox.showinfo("정보", "커밋할 변경사항이 없습니다")
                 return
 
-            # 모든 변경사항 추가
-            self.repo.git.add(A=True)
-            self.log_message("모든 변경사항 추가됨", "success")
+            # 변경사항 미리보기
+            if preview and self.config.get("show_push_preview", True):
+                pathspecs = self.get_churn_pathspecs(self.repo.working_tree_dir)
+                if not PushPreviewDialog(self.root, self.repo, pathspecs).show():
+                    self.log_message("Quick Push 취소됨", "info")
+                    return
 
-            # 커밋
-            commit_msg = self.config.get("commit_message", "update")
-            self.repo.index.commit(commit_msg)
+            # 모든 변경사항 추가 및 커밋
+            commit_msg = self.commit_all(self.repo)
             self.log_message(f"커밋 완료: {commit_msg}", "success")
 
             # 푸시
-            origin = self.repo.remotes.origin
-            result = origin.push()
+            result = self.push_repo(self.repo)
             self.log_message(f"Push 완료: {result}", "success")
+            self.update_search_index([self.config.get("repo_path", "")])
 
             self.refresh_status()
             messagebox.showinfo("성공", "Push가 성공적으로 완료되었습니다!")
@@ -324,6 +1037,217 @@ class GitManager:
             self.log_message(f"Push 오류: {e}", "error")
             messagebox.showerror("오류", f"Push 실패:\n{e}")
 
+    def commit_all(self, repo):
+        """모든 변경사항을 추가하고 커밋 메시지 템플릿으로 커밋
+
+        합치기 설정이 켜져 있으면 아직 push되지 않은 연속된 자동 커밋을
+        이번 커밋과 하나로 합칩니다. 커밋 메시지 첫 줄을 반환합니다.
+        """
+        repo.git.add("-A", "--", *(self.get_churn_pathspecs(repo.working_tree_dir) or ["."]))
+        commit_msg = self.config.get("commit_message", "update")
+
+        squashed = []
+        if self.config.get("coalesce_commits", False):
+            squashed = self.find_coalescable_commits(repo, commit_msg)
+        base = squashed[-1].parents[0].hexsha if squashed else None
+
+        message = commit_msg
+        if self.config.get("summarize_commit_message", False):
+            message = self.build_summary_message(repo, commit_msg, base)
+
+        if not squashed:
+            repo.index.commit(message)
+            return message.splitlines()[0]
+
+        # 합칠 커밋들의 부모로 HEAD만 옮기고(index는 유지) 한 번에 다시 커밋
+        old_head = repo.head.commit.hexsha
+        repo.git.reset("--soft", base)
+        new_head = repo.index.commit(message).hexsha
+
+        dropped_objects = repo.git.rev_list("--objects", old_head, "--not", new_head).splitlines()
+        self.log_message(f"자동 커밋 합치기: {len(squashed) + 1}개 → 1개 "
+                         f"(커밋 {len(squashed)}개, 객체 {len(dropped_objects)}개 절약)", "success")
+        return message.splitlines()[0]
+
+    def get_churn_pathspecs(self, repo_path):
+        """편집기 상태 파일을 제외하는 git pathspec 목록 (필터가 꺼져 있으면 빈 리스트)
+
+        저장소 항목에 "churn_patterns"가 있으면 전역 설정 대신 사용합니다.
+        """
+        if not self.config.get("churn_filter_enabled", True):
+            return []
+
+        patterns = self.config.get("churn_patterns", self.DEFAULT_CHURN_PATTERNS)
+        normalized = os.path.normcase(os.path.abspath(repo_path))
+        for repo_info in self.config.get("repositories", []):
+            if os.path.normcase(os.path.abspath(repo_info['path'])) == normalized:
+                patterns = repo_info.get("churn_patterns", patterns)
+                break
+
+        if not patterns:
+            return []
+        return ["."] + [f":(exclude,glob){pattern}" for pattern in patterns]
+
+    def check_changes(self, repo):
+        """변경사항 상태 확인
+
+        "dirty"(커밋할 변경 있음), "churn"(편집기 상태 파일만 변경), "clean"(변경 없음) 중 하나를 반환합니다.
+        """
+        pathspecs = self.get_churn_pathspecs(repo.working_tree_dir)
+        if not pathspecs:
+            return "dirty" if repo.is_dirty(untracked_files=True) else "clean"
+
+        status = repo.git.status("--porcelain", "-z", "--untracked-files=normal", "--", *pathspecs)
+        if status:
+            return "dirty"
+        return "churn" if repo.is_dirty(untracked_files=True) else "clean"
+
+    def find_coalescable_commits(self, repo, commit_msg):
+        """HEAD부터 연속된, 어느 push 대상에도 없는 자동 커밋 목록 (최신순)
+
+        remote 추적 브랜치나 미러 push 기록(PUSHED_REF_PREFIX)에서 닿을 수 있는 커밋,
+        지금 미러로 push 중인 커밋, 병합 커밋, 직접 작성한 커밋을 만나면 멈추므로
+        이미 push된 기록은 절대 바꾸지 않습니다.
+        """
+        with self.mirror_lock:
+            inflight = list(self.mirror_inflight.get(repo.working_tree_dir, []))
+        try:
+            commit = repo.head.commit
+            unpushed = set(repo.git.rev_list("HEAD", "--not", "--remotes",
+                                             f"--glob={self.PUSHED_REF_PREFIX}*", *inflight).split())
+        except (ValueError, git.GitCommandError):
+            return []
+
+        squashed = []
+        while (commit.hexsha in unpushed and len(commit.parents) == 1
+               and self.is_auto_commit(commit, commit_msg)):
+            squashed.append(commit)
+            commit = commit.parents[0]
+        return squashed
+
+    @staticmethod
+    def is_auto_commit(commit, commit_msg):
+        """커밋 메시지 템플릿으로 만든 커밋인지 확인 (build_summary_message 형식 포함)"""
+        return (commit.summary == commit_msg
+                or re.fullmatch(rf"{re.escape(commit_msg)} \(\d+개 파일\)", commit.summary) is not None)
+
+    def build_summary_message(self, repo, commit_msg, base=None):
+        """스테이징된 변경 파일 목록을 담은 커밋 메시지 생성
+
+        base를 지정하면 그 커밋과 비교하고, 없으면 HEAD(첫 커밋이면 빈 트리)와 비교합니다.
+        """
+        if base is None:
+            base = "HEAD" if repo.head.is_valid() else self.EMPTY_TREE_SHA
+        output = repo.git.diff("--cached", "--name-only", "--no-renames", "-z", base)
+        paths = [path for path in output.split("\0") if path]
+
+        lines = [f"{commit_msg} ({len(paths)}개 파일)", ""]
+        lines += [f"- {path}" for path in paths[:self.MAX_SUMMARY_FILES]]
+        if len(paths) > self.MAX_SUMMARY_FILES:
+            lines.append(f"- ... 외 {len(paths) - self.MAX_SUMMARY_FILES}개")
+        return "\n".join(lines)
+
+    def push_repo(self, repo):
+        """origin과 추가 push 대상(백업 미러)에 동시에 push
+
+        미러 push는 백그라운드 스레드에서 시작하고 origin 결과만 기다립니다.
+        결과는 push_result_queue를 거쳐 Tk 스레드에서 로그와 push_results에 기록됩니다.
+        """
+        repo_path = repo.working_tree_dir
+        mirrors = self.get_push_remotes(repo_path)
+        if mirrors and repo.head.is_detached:
+            for target in mirrors:
+                self.push_result_queue.put((repo_path, target, False, 0.0, "브랜치가 없는 HEAD는 push하지 않음"))
+        elif mirrors:
+            # 지금 HEAD를 그대로 보내야 push 중에 커밋 합치기가 일어나도 결과가 어긋나지 않음
+            sha = repo.head.commit.hexsha
+            branch = repo.active_branch.name
+            for target in mirrors:
+                with self.mirror_lock:
+                    self.mirror_inflight.setdefault(repo_path, []).append(sha)
+                thread = threading.Thread(target=self.run_mirror_push,
+                                          args=(repo_path, target, sha, branch), daemon=True)
+                thread.start()
+
+        start = time.perf_counter()
+        try:
+            result = repo.remotes.origin.push()
+        except Exception as e:
+            self.push_result_queue.put((repo_path, "origin", False, time.perf_counter() - start, str(e)))
+            raise
+        self.push_result_queue.put((repo_path, "origin", True, time.perf_counter() - start, None))
+        return result
+
+    def run_mirror_push(self, repo_path, target, sha, branch):
+        """미러 push 작업 스레드 (동시 실행 수 제한)"""
+        try:
+            with self.mirror_slots:
+                if self.closing:
+                    return
+                result = self.push_to_mirror(repo_path, target, sha, branch)
+                self.push_result_queue.put((repo_path, target, *result))
+        finally:
+            with self.mirror_lock:
+                self.mirror_inflight[repo_path].remove(sha)
+
+    def push_to_mirror(self, repo_path, target, sha, branch):
+        """추가 push 대상 하나에 커밋 sha를 branch로 push (제한 시간 초과 시 중단)
+
+        성공하면 대상별 ref(PUSHED_REF_PREFIX)에 sha를 기록해, URL로 지정한 미러처럼
+        remote 추적 브랜치가 없는 대상도 커밋 합치기에서 push된 것으로 취급합니다.
+        (성공 여부, 소요 시간, 오류 메시지)를 반환합니다.
+        """
+        timeout = self.config.get("mirror_push_timeout", 120)
+        start = time.perf_counter()
+        try:
+            proc = git.Git(repo_path).execute(["git", "push", target, f"{sha}:refs/heads/{branch}"],
+                                              as_process=True)
+            with self.mirror_lock:
+                self.mirror_processes.add(proc.proc)
+                if self.closing:
+                    proc.proc.kill()
+            try:
+                _, stderr = proc.proc.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                # 하위 프로세스가 파이프를 잡고 있을 수 있으므로 출력은 읽지 않음
+                proc.proc.kill()
+                proc.proc.wait()
+                return False, time.perf_counter() - start, f"{timeout}초 제한 시간 초과"
+            finally:
+                with self.mirror_lock:
+                    self.mirror_processes.discard(proc.proc)
+
+            if proc.proc.returncode != 0:
+                error = stderr.decode("utf-8", errors="replace").strip()
+                return False, time.perf_counter() - start, error
+
+            target_key = hashlib.sha1(target.encode("utf-8")).hexdigest()[:16]
+            git.Git(repo_path).update_ref(self.PUSHED_REF_PREFIX + target_key, sha)
+            return True, time.perf_counter() - start, None
+        except Exception as e:
+            return False, time.perf_counter() - start, str(e)
+
+    def record_push_result(self, repo_path, target, success, latency, error=None):
+        """대상별 push 결과와 소요 시간 기록 (Tk 스레드 전용)"""
+        self.push_results[(repo_path, target)] = {
+            "success": success,
+            "latency": latency,
+            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "error": error,
+        }
+        if success:
+            self.log_message(f"  ↳ {target} push 완료 ({latency:.2f}초): {repo_path}", "success")
+        else:
+            self.log_message(f"  ↳ {target} push 실패 ({latency:.2f}초): {repo_path} - {error}", "error")
+
+    def get_push_remotes(self, repo_path):
+        """저장소에 설정된 추가 push 대상(remote 이름 또는 URL) 목록"""
+        normalized = os.path.normcase(os.path.abspath(repo_path))
+        for repo_info in self.config.get("repositories", []):
+            if os.path.normcase(os.path.abspath(repo_info['path'])) == normalized:
+                return repo_info.get("push_remotes", [])
+        return []
+
     def refresh_status(self):
         """git 상태 새로고침"""
         if not self.repo:
@@ -360,6 +1284,58 @@ class GitManager:
         except Exception as e:
             self.log_message(f"히스토리 오류: {e}", "error")
 
+    def update_search_index(self, repo_paths=None):
+        """등록된 저장소의 검색 색인을 백그라운드에서 갱신
+
+        repo_paths를 지정하면 그 중 등록된 저장소만 갱신합니다.
+        """
+        repositories = self.config.get("repositories", [])
+        if repo_paths is not None:
+            repositories = [r for r in repositories if r['path'] in repo_paths]
+        if not repositories:
+            return
+
+        thread = threading.Thread(target=self.run_search_index_update, args=(repositories,), daemon=True)
+        thread.start()
+
+    def run_search_index_update(self, repositories):
+        """검색 색인 갱신 작업 (백그라운드 스레드)"""
+        for repo_info in repositories:
+            try:
+                note_count, commit_count = self.search_index.update_repo(repo_info['path'])
+                if note_count or commit_count:
+                    self.log_message(f"검색 색인 갱신됨: {repo_info['name']} "
+                                     f"(노트 {note_count}개, 커밋 {commit_count}개)", "info")
+            except Exception as e:
+                self.log_message(f"검색 색인 오류: {repo_info['name']} - {e}", "error")
+
+    def run_search(self, event=None):
+        """검색 색인에서 노트와 커밋 검색"""
+        query = self.search_var.get().strip()
+        self.search_tree.delete(*self.search_tree.get_children())
+        if not query:
+            return
+
+        repo_names = {r['path']: r['name'] for r in self.config.get("repositories", [])}
+        kind_labels = {"note": "노트", "commit": "커밋"}
+
+        start = time.perf_counter()
+        try:
+            results = self.search_index.search(query)
+        except Exception as e:
+            self.search_status_var.set(f"검색 오류: {e}")
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        for kind, repo_path, item, snippet in results:
+            self.search_tree.insert("", tk.END, values=(
+                kind_labels[kind],
+                repo_names.get(repo_path, repo_path),
+                item,
+                " ".join(snippet.split()),
+            ))
+        self.search_status_var.set(f"검색 결과 {len(results)}개 ({elapsed_ms:.1f}ms)")
+
     def toggle_auto_sync(self):
         """자동 동기화 켜기/끄기"""
         enabled = self.auto_sync_var.get()
@@ -401,14 +1377,16 @@ class GitManager:
         self.sync_thread.start()
 
         self.log_message(f"자동 동기화 활성화됨: Pull {pull_time}, Push {push_time}", "success")
-        self.update_schedule_status()
+        if self.ui_active:
+            self.update_schedule_status()
 
     def stop_auto_sync(self):
         """자동 동기화 스케줄러 중지"""
         self.sync_running = False
         schedule.clear()
         self.log_message("자동 동기화 비활성화됨", "info")
-        self.update_schedule_status()
+        if self.ui_active:
+            self.update_schedule_status()
 
     def run_schedule(self):
         """스케줄러 루프 실행"""
@@ -419,12 +1397,49 @@ class GitManager:
     def scheduled_pull(self):
         """예약된 pull 작업"""
         self.log_message("자동 동기화: 예약된 pull 실행 중", "info")
-        self.quick_pull()
+        if self.ui_active:
+            self.quick_pull()
+        else:
+            self.background_sync("pull")
 
     def scheduled_push(self):
         """예약된 push 작업"""
         self.log_message("자동 동기화: 예약된 push 실행 중", "info")
-        self.quick_push()
+        if self.ui_active:
+            self.quick_push(preview=False)
+        else:
+            self.background_sync("push")
+
+    def background_sync(self, action):
+        """UI 없이 실행하는 최소 동기화 (트레이 저자원 모드용)
+
+        현재 선택된 저장소가 없으면(ALL) 등록된 전체 저장소를 대상으로 하며,
+        저장소 핸들은 작업이 끝나면 바로 닫습니다.
+        """
+        current_path = self.config.get("repo_path", "")
+        if current_path:
+            targets = [current_path]
+        else:
+            targets = [r['path'] for r in self.config.get("repositories", [])]
+
+        updated_paths = []
+        for path in targets:
+            try:
+                with git.Repo(path) as repo:
+                    if action == "pull":
+                        repo.remotes.origin.pull()
+                    elif self.check_changes(repo) != "dirty":
+                        self.log_message(f"  ○ 건너뜀: {path} (변경사항 없음)", "info")
+                        continue
+                    else:
+                        self.commit_all(repo)
+                        self.push_repo(repo)
+                self.log_message(f"  ✓ 자동 {action} 완료: {path}", "success")
+                updated_paths.append(path)
+            except Exception as e:
+                self.log_message(f"  ✗ 자동 {action} 실패: {path} - {e}", "error")
+
+        self.update_search_index(updated_paths)
 
     def update_schedule_status(self):
         """일정 상태 표시 업데이트"""
@@ -448,8 +1463,15 @@ class GitManager:
     def save_settings(self):
         """설정 저장"""
         self.config["commit_message"] = self.commit_msg_var.get()
+        self.config["summarize_commit_message"] = self.summarize_commit_message_var.get()
+        self.config["coalesce_commits"] = self.coalesce_commits_var.get()
+        self.config["churn_filter_enabled"] = self.churn_filter_var.get()
+        self.config["churn_patterns"] = [pattern.strip() for pattern in self.churn_patterns_var.get().split(",")
+                                         if pattern.strip()]
         self.config["minimize_to_tray"] = self.minimize_to_tray_var.get()
+        self.config["low_footprint_tray"] = self.low_footprint_tray_var.get()
         self.config["auto_start"] = self.auto_start_var.get()
+        self.config["show_push_preview"] = self.show_push_preview_var.get()
 
         # 자동 시작 설정 적용
         if self.auto_start_var.get():
@@ -461,12 +1483,51 @@ class GitManager:
         messagebox.showinfo("성공", "설정이 저장되었습니다!")
 
     def log_message(self, message, msg_type="info"):
-        """로그에 메시지 추가"""
+        """로그에 메시지 추가
+
+        어느 스레드에서든 호출할 수 있습니다. 로그는 먼저 pending_logs에 쌓이고,
+        위젯에는 Tk 스레드에서만 반영됩니다.
+        """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] {message}\n"
-        self.log_text.insert(tk.END, log_entry, msg_type)
+        with self.log_lock:
+            self.pending_logs.append((log_entry, msg_type))
+
+        if threading.current_thread() is threading.main_thread():
+            self.flush_logs()
+
+    def flush_logs(self):
+        """쌓인 로그를 로그 탭에 반영 (Tk 스레드 전용, UI가 없으면 그대로 보관)"""
+        if not self.ui_active:
+            return
+
+        with self.log_lock:
+            entries = list(self.pending_logs)
+            self.pending_logs.clear()
+        if not entries:
+            return
+
+        for log_entry, msg_type in entries:
+            self.log_text.insert(tk.END, log_entry, msg_type)
+        self.trim_log()
         self.log_text.see(tk.END)
 
+    def process_pending_events(self):
+        """백그라운드 스레드가 남긴 push 결과와 로그를 Tk 스레드에서 주기적으로 반영"""
+        while True:
+            try:
+                self.record_push_result(*self.push_result_queue.get_nowait())
+            except queue.Empty:
+                break
+        self.flush_logs()
+        self.root.after(self.EVENT_POLL_MS, self.process_pending_events)
+
+    def trim_log(self):
+        """로그가 최대 줄 수를 넘으면 오래된 줄 삭제"""
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > self.MAX_LOG_LINES:
+            self.log_text.delete(1.0, f"{line_count - self.MAX_LOG_LINES + 1}.0")
+
     # 저장소 관리 메서드들
     def refresh_repo_combo(self):
         """저장소 콤보박스 새로고침"""
@@ -546,9 +1607,32 @@ class GitManager:
         self.config["repositories"] = repositories
         self.save_config()
         self.refresh_repo_combo()
+        self.update_search_index([current_path])
         self.log_message(f"저장소 저장됨: {name} ({current_path})", "success")
         messagebox.showinfo("성공", f"저장소가 저장되었습니다: {name}")
 
+    def edit_push_remotes(self):
+        """선택된 저장소의 추가 push 대상(백업 미러) 편집"""
+        current_path = self.config.get("repo_path", "")
+        repositories = self.config.get("repositories", [])
+        repo_info = next((r for r in repositories if r['path'] == current_path), None)
+        if not repo_info:
+            messagebox.showwarning("경고", "먼저 등록된 저장소를 선택해주세요")
+            return
+
+        current = ", ".join(repo_info.get("push_remotes", []))
+        value = simpledialog.askstring("추가 push 대상",
+                                       "origin 외에 함께 push할 remote 이름 또는 URL을 입력하세요\n"
+                                       "(여러 개는 쉼표로 구분, 비우면 해제):",
+                                       initialvalue=current)
+        if value is None:
+            return
+
+        repo_info["push_remotes"] = [target.strip() for target in value.split(",") if target.strip()]
+        self.save_config()
+        self.log_message(f"추가 push 대상 설정됨: {repo_info['name']} → "
+                         f"{', '.join(repo_info['push_remotes']) or '없음'}", "success")
+
     def delete_current_repo(self):
         """선택된 저장소를 리스트에서 삭제"""
         selected = self.repo_combo_var.get()
@@ -572,6 +1656,11 @@ class GitManager:
                 removed_repo = repositories.pop(idx)
                 self.config["repositories"] = repositories
 
+                try:
+                    self.search_index.remove_repo(removed_repo['path'])
+                except Exception as e:
+                    self.log_message(f"검색 색인 삭제 오류: {e}", "error")
+
                 # 현재 선택된 저장소인 경우 초기화
                 if self.config.get("repo_path") == repo['path']:
                     self.repo = None
@@ -600,19 +1689,22 @@ class GitManager:
         self.log_message(f"=== 전체 저장소 Pull 시작 (총 {len(repositories)}개) ===", "info")
         success_count = 0
         fail_count = 0
+        updated_paths = []
 
         for repo_info in repositories:
             try:
                 self.log_message(f"Pull 중: {repo_info['name']} ({repo_info['path']})", "info")
-                repo = git.Repo(repo_info['path'])
-                origin = repo.remotes.origin
-                result = origin.pull()
+                with git.Repo(repo_info['path']) as repo:
+                    repo.remotes.origin.pull()
                 self.log_message(f"  ✓ 완료: {repo_info['name']}", "success")
                 success_count += 1
+                updated_paths.append(repo_info['path'])
             except Exception as e:
                 self.log_message(f"  ✗ 실패: {repo_info['name']} - {e}", "error")
                 fail_count += 1
 
+        self.update_search_index(updated_paths)
+
         summary = f"=== 전체 Pull 완료: 성공 {success_count}개, 실패 {fail_count}개 ==="
         self.log_message(summary, "success" if fail_count == 0 else "info")
         messagebox.showinfo("완료", f"전체 Pull이 완료되었습니다\n성공: {success_count}개\n실패: {fail_count}개")
@@ -633,35 +1725,47 @@ class GitManager:
         success_count = 0
         fail_count = 0
         skip_count = 0
-
-        commit_msg = self.config.get("commit_message", "update")
+        churn_count = 0
+        mirror_count = 0
+        updated_paths = []
 
         for repo_info in repositories:
             try:
                 self.log_message(f"Push 중: {repo_info['name']} ({repo_info['path']})", "info")
-                repo = git.Repo(repo_info['path'])
-
-                # 변경사항 확인
-                if not repo.is_dirty(untracked_files=True):
-                    self.log_message(f"  ○ 건너뜀: {repo_info['name']} (변경사항 없음)", "info")
-                    skip_count += 1
-                    continue
-
-                # Add, Commit, Push
-                repo.git.add(A=True)
-                repo.index.commit(commit_msg)
-                origin = repo.remotes.origin
-                result = origin.push()
+                with git.Repo(repo_info['path']) as repo:
+                    # 변경사항 확인 (편집기 상태 파일 변경은 제외)
+                    changes = self.check_changes(repo)
+                    if changes == "churn":
+                        self.log_message(f"  ○ 건너뜀: {repo_info['name']} (편집기 상태 파일만 변경)", "info")
+                        skip_count += 1
+                        churn_count += 1
+                        continue
+                    if changes == "clean":
+                        self.log_message(f"  ○ 건너뜀: {repo_info['name']} (변경사항 없음)", "info")
+                        skip_count += 1
+                        continue
+
+                    # Add, Commit, Push (추가 push 대상은 백그라운드에서 진행)
+                    self.commit_all(repo)
+                    self.push_repo(repo)
+                    mirror_count += len(repo_info.get("push_remotes", []))
                 self.log_message(f"  ✓ 완료: {repo_info['name']}", "success")
                 success_count += 1
+                updated_paths.append(repo_info['path'])
             except Exception as e:
                 self.log_message(f"  ✗ 실패: {repo_info['name']} - {e}", "error")
                 fail_count += 1
 
-        summary = f"=== 전체 Push 완료: 성공 {success_count}개, 실패 {fail_count}개, 건너뜀 {skip_count}개 ==="
+        self.update_search_index(updated_paths)
+
+        summary = (f"=== 전체 Push 완료: 성공 {success_count}개, 실패 {fail_count}개, "
+                   f"건너뜀 {skip_count}개 (상태 파일만 변경 {churn_count}개) ===")
         self.log_message(summary, "success" if fail_count == 0 else "info")
+        if mirror_count:
+            self.log_message(f"추가 push 대상 {mirror_count}개는 백그라운드에서 진행 중", "info")
         messagebox.showinfo("완료",
-                          f"전체 Push가 완료되었습니다\n성공: {success_count}개\n실패: {fail_count}개\n건너뜀: {skip_count}개")
+                          f"전체 Push가 완료되었습니다\n성공: {success_count}개\n실패: {fail_count}개\n"
+                          f"건너뜀: {skip_count}개 (상태 파일만 변경 {churn_count}개)")
 
     # 시스템 트레이 및 자동 시작 기능
     def on_closing(self):
@@ -675,6 +1779,7 @@ class GitManager:
 
     def minimize_to_system_tray(self):
         """시스템 트레이로 최소화"""
+        memory_before = get_resident_memory()
         self.root.withdraw()  # 윈도우 숨기기
         self.minimized_to_tray = True
 
@@ -684,6 +1789,44 @@ class GitManager:
 
         self.log_message("백그라운드로 실행 중 (시스템 트레이)", "info")
 
+        if self.config.get("low_footprint_tray", True):
+            self.release_resources()
+            memory_after = get_resident_memory()
+            self.log_message(f"저자원 모드 전환: 메모리 {format_memory(memory_before)} → "
+                             f"{format_memory(memory_after)}", "info")
+
+    def release_resources(self):
+        """트레이 실행 중 필요 없는 UI와 저장소 핸들 해제
+
+        위젯 트리를 모두 없애고 git.Repo를 닫아 cat-file 프로세스를 종료합니다.
+        이후 로그는 pending_logs에 쌓이고, UI는 show_from_tray에서 다시 만듭니다.
+        ui_active와 위젯은 Tk 스레드에서만 다루므로 다른 스레드의 로그와 겹치지 않습니다.
+        """
+        self.ui_active = False
+        for child in self.root.winfo_children():
+            child.destroy()
+
+        if self.repo:
+            self.repo.close()
+            self.repo = None
+
+        gc.collect()
+
+    def rebuild_ui(self):
+        """저자원 모드에서 해제한 UI와 저장소 핸들 복구"""
+        self.create_ui()
+
+        repo_path = self.config.get("repo_path", "")
+        if repo_path:
+            try:
+                self.repo = git.Repo(repo_path)
+                self.refresh_status()
+            except Exception as e:
+                self.log_message(f"저장소 로드 오류: {e}", "error")
+
+        if self.sync_running:
+            self.update_schedule_status()
+
     def create_tray_icon(self):
         """시스템 트레이 아이콘 생성"""
         # 간단한 아이콘 이미지 생성 (G 문자)
@@ -706,7 +1849,15 @@ class GitManager:
         tray_thread.start()
 
     def show_from_tray(self, icon=None, item=None):
-        """트레이에서 윈도우 복원"""
+        """트레이에서 윈도우 복원 (트레이 스레드에서 호출되므로 Tk 스레드로 넘김)"""
+        self.root.after(0, self.restore_from_tray)
+
+    def restore_from_tray(self):
+        """윈도우 복원 (필요하면 UI 재생성)"""
+        if not self.ui_active:
+            self.rebuild_ui()
+            self.log_message(f"화면 복원됨: 메모리 {format_memory(get_resident_memory())}", "info")
+
         self.root.deiconify()  # 윈도우 보이기
         self.root.lift()  # 맨 앞으로
         self.minimized_to_tray = False
@@ -731,6 +1882,15 @@ class GitManager:
         if self.tray_icon:
             self.tray_icon.stop()
 
+        # 남은 미러 push는 기다리지 않고 실행 중인 git 프로세스 종료
+        with self.mirror_lock:
+            self.closing = True
+            for proc in self.mirror_processes:
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
+
         self.log_message("Git Manager 종료", "info")
         self.root.quit()
         self.root.destroy()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+PushPreviewDialog 스트리밍 회귀 테스트
+"""
+
+import queue
+import subprocess
+import time
+
+import pytest
+
+pytest.importorskip("winreg")
+pytest.importorskip("pystray")
+pytest.importorskip("PIL")
+
+import git
+
+import git_manager
+
+
+def run_git(repo_dir, *args):
+    subprocess.run(["git", *args], cwd=repo_dir, check=True, capture_output=True)
+
+
+@pytest.fixture
+def autocrlf_repo(tmp_path):
+    """core.autocrlf=true에서 LF 노트가 잔뜩 바뀐 저장소 (git이 stderr에 경고를 대량 출력)"""
+    run_git(tmp_path, "init", "-q")
+    run_git(tmp_path, "config", "user.email", "test@example.com")
+    run_git(tmp_path, "config", "user.name", "test")
+    run_git(tmp_path, "config", "core.autocrlf", "true")
+
+    note_count = 1500
+    for i in range(note_count):
+        (tmp_path / f"note{i}.md").write_bytes(f"note {i}\n".encode())
+    run_git(tmp_path, "add", ".")
+    run_git(tmp_path, "commit", "-q", "-m", "init")
+
+    for i in range(note_count):
+        with open(tmp_path / f"note{i}.md", "ab") as f:
+            f.write(b"more\n")
+    run_git(tmp_path, "add", *[f"note{i}.md" for i in range(note_count // 3)])
+    for i in range(10):
+        (tmp_path / f"new{i}.md").write_bytes(b"new\n")
+
+    return tmp_path
+
+
+def test_streams_finish_with_autocrlf_warnings(autocrlf_repo):
+    """stderr 경고가 파이프를 가득 채워도 세 구분 모두 끝까지 읽혀야 함"""
+    dialog = git_manager.PushPreviewDialog.__new__(git_manager.PushPreviewDialog)
+    dialog.repo = git.Repo(autocrlf_repo)
+    dialog.queue = queue.Queue()
+    dialog.processes = []
+    dialog.pathspecs = []
+    dialog.closed = False
+    dialog.start_streams()
+
+    done = set()
+    counts = {"staged": 0, "unstaged": 0, "untracked": 0}
+    deadline = time.monotonic() + 30
+    while len(done) < 3:
+        kind, payload = dialog.queue.get(timeout=max(deadline - time.monotonic(), 0.1))
+        if kind == "files":
+            for section, *_ in payload:
+                counts[section] += 1
+        elif kind == "done":
+            done.add(payload)
+        elif kind == "error":
+            pytest.fail(payload)
+
+    assert done == {"staged", "unstaged", "untracked"}
+    assert counts == {"staged": 500, "unstaged": 1000, "untracked": 10}